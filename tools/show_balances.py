@@ -1,39 +1,74 @@
+import argparse
 import json
 from pprint import pprint
+from typing import Optional
 
 import btc_bot
 
-def main():
+# Common balance/account methods to try on the client, in order
+CANDIDATES = (
+    "get_accounts",
+    "list_accounts",
+    "get_wallets",
+    "get_balances",
+    "get_all_accounts",
+)
+
+# Method that worked last time, so repeated calls in one process skip the probe
+_DISCOVERED_METHOD: Optional[str] = None
+
+
+def fetch_balances(client):
+    """Call the first known balance method the client exposes.
+
+    Returns (method_name, response), or (None, None) if no candidate worked.
+    """
+    global _DISCOVERED_METHOD
+
+    names = CANDIDATES
+    if _DISCOVERED_METHOD:
+        names = (_DISCOVERED_METHOD,) + tuple(n for n in CANDIDATES if n != _DISCOVERED_METHOD)
+
+    for name in names:
+        fn = getattr(client, name, None)
+        if fn is None or not callable(fn):
+            continue
+        try:
+            res = fn()
+        except Exception as e:
+            print(f"client.{name}() raised: {e}")
+            continue
+        _DISCOVERED_METHOD = name
+        return name, res
+
+    return None, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show the balances your Coinbase API key can access.")
+    parser.add_argument("--debug", action="store_true",
+                        help="list the client's methods if no known balance method works")
+    args = parser.parse_args(argv)
+
     client = btc_bot.get_client()
 
-    # Try common balance/account methods on the client
-    candidates = [
-        "get_accounts",
-        "list_accounts",
-        "get_wallets",
-        "get_balances",
-        "get_all_accounts",
-    ]
-
-    for name in candidates:
-        if hasattr(client, name):
-            try:
-                fn = getattr(client, name)
-                res = fn() if callable(fn) else fn
-                print(f"Using client.{name}() ->")
-                try:
-                    print(json.dumps(res, default=str, indent=2))
-                except Exception:
-                    pprint(res)
-                return
-
-            except Exception as e:
-                print(f"client.{name}() raised: {e}")
-
-    # Fallback: show available client attributes to help you pick a method
-    attrs = [a for a in dir(client) if not a.startswith("_")]
-    print("Could not call a known balance method. Client exposes these attributes/methods:")
+    name, res = fetch_balances(client)
+    if name:
+        print(f"Using client.{name}() ->")
+        try:
+            print(json.dumps(res, default=str, indent=2))
+        except Exception:
+            pprint(res)
+        return
+
+    if not args.debug:
+        print("Could not call a known balance method. Re-run with --debug to list the client's methods.")
+        return
+
+    # Fallback: show the client's own methods to help you pick one
+    attrs = sorted(a for a in vars(type(client)) if not a.startswith("_"))
+    print("Could not call a known balance method. Client exposes these methods:")
     pprint(attrs)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()